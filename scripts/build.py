@@ -6,23 +6,36 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import math
 import os
 import shutil
 import subprocess
 import sys
+import tempfile
+from collections import deque
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
-REPOSITORY_ROOT = Path(__file__).resolve().parent.parent
+BUILD_SCRIPT = Path(__file__).resolve()
+REPOSITORY_ROOT = BUILD_SCRIPT.parent.parent
 OUTPUTS_DIR = REPOSITORY_ROOT / "outputs"
 CACHE_DIR = REPOSITORY_ROOT / ".cache"
 OUT_DIR = CACHE_DIR / "out"
 AUX_DIR = CACHE_DIR / "aux"
+PROFILE_CACHE_DIR = CACHE_DIR / "profiles"
+STAMPS_DIR = CACHE_DIR / "stamps"
 LATEXMKRC = REPOSITORY_ROOT / ".latexmkrc"
 PROFILES_DIR = REPOSITORY_ROOT / "profiles"
 RESUME_TEX = REPOSITORY_ROOT / "resume.tex"
+RESUME_STY = REPOSITORY_ROOT / "resume.sty"
+SECTIONS_DIR = REPOSITORY_ROOT / "sections"
+ASSETS_DIR = REPOSITORY_ROOT / "assets"
 
 SUPPORTED_SECTIONS = {
     "header",
@@ -50,6 +63,21 @@ class ProfileConfig:
     section_order: tuple[str, ...]
     included_sections: tuple[str, ...]
     keyword_emphasis: tuple[str, ...]
+    rendered_sections: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ProfileBuild:
+    profile: ProfileConfig
+    generated_source: Path
+    source_pdf: Path
+    final_pdf: Path
+    log_file: Path
+    log_mtime_ns: int | None
+    latexmk_log: Path
+    stamp_file: Path
+    contents: bytes
+    digest: str
 
 
 def main() -> None:
@@ -59,7 +87,7 @@ def main() -> None:
         ensure_paths()
         profiles = load_profiles()
         selected_profiles = select_profiles(profiles, args.profile)
-        built_pdfs = [build_profile(profile) for profile in selected_profiles]
+        built_pdfs = build_profiles(selected_profiles, args.jobs, args.force)
 
         if args.open and built_pdfs:
             open_pdf(built_pdfs[0])
@@ -77,6 +105,18 @@ def parse_args() -> argparse.Namespace:
         default=None,
         help="Profile variant to build. Builds all profiles when omitted.",
     )
+    parser.add_argument(
+        "--jobs",
+        metavar="JOBS",
+        type=positive_int,
+        default=None,
+        help="Maximum number of profiles to build in parallel. Defaults to the CPU count.",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rebuild profiles even when their inputs are unchanged.",
+    )
     parser.add_argument(
         "--open",
         action="store_true",
@@ -85,6 +125,18 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"invalid integer value: '{value}'") from exc
+
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {number}")
+
+    return number
+
+
 def ensure_paths() -> None:
     for path in (RESUME_TEX, LATEXMKRC, PROFILES_DIR):
         if not path.exists():
@@ -92,6 +144,7 @@ def ensure_paths() -> None:
 
     OUT_DIR.mkdir(parents=True, exist_ok=True)
     AUX_DIR.mkdir(parents=True, exist_ok=True)
+    STAMPS_DIR.mkdir(parents=True, exist_ok=True)
     OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
@@ -123,12 +176,16 @@ def load_profile(profile_path: Path) -> ProfileConfig:
 
     validate_sections(section_order, included_sections, profile_path)
 
+    included = set(included_sections)
+    rendered_sections = tuple(section for section in section_order if section in included)
+
     return ProfileConfig(
         profile=profile,
         name=name,
         section_order=tuple(section_order),
         included_sections=tuple(included_sections),
         keyword_emphasis=tuple(keyword_emphasis),
+        rendered_sections=rendered_sections,
     )
 
 
@@ -148,58 +205,238 @@ def select_profiles(
     return [profiles[requested_profile]]
 
 
-def build_profile(profile: ProfileConfig) -> Path:
+def build_profiles(
+    profiles: list[ProfileConfig],
+    jobs: int | None,
+    force: bool = False,
+) -> list[Path]:
+    max_jobs = max(1, min(len(profiles), jobs or os.cpu_count() or 1))
+    staged: list[ProfileBuild] = []
+    running: deque[tuple[ProfileBuild, subprocess.Popen[bytes]]] = deque()
+    final_pdfs: list[Path] = []
+
+    try:
+        # Each profile compiles its own generated source and job name, so the
+        # latexmk processes share no intermediate files and can overlap.
+        # Profiles are staged just before launch, so rendering later sources
+        # runs alongside the compiles already in flight.
+        for profile in profiles:
+            build = prepare_build(profile)
+            final_pdfs.append(build.final_pdf)
+
+            if not force and is_up_to_date(build):
+                print_up_to_date(build.profile, build.final_pdf)
+                continue
+
+            stage_source(build)
+            staged.append(build)
+
+            if len(running) >= max_jobs:
+                finish_build(*running.popleft())
+
+            running.append((build, start_build(build)))
+
+        while running:
+            finish_build(*running.popleft())
+
+        return final_pdfs
+
+    finally:
+        for _, process in running:
+            process.terminate()
+            process.wait()
+
+        for build in staged:
+            build.generated_source.unlink(missing_ok=True)
+
+
+def prepare_build(profile: ProfileConfig) -> ProfileBuild:
     generated_source = REPOSITORY_ROOT / f"resume-{profile.profile}.generated.tex"
-    source_pdf = OUT_DIR / f"{generated_source.stem}.pdf"
-    final_pdf = OUTPUTS_DIR / f"resume-{profile.profile}.pdf"
     log_file = AUX_DIR / f"{generated_source.stem}.log"
+    contents = render_resume(profile)
+    digest = hashlib.blake2b(input_fingerprint(), digest_size=16)
+    digest.update("\0".join(latexmk_options()).encode("utf-8"))
+    digest.update(contents)
+
+    return ProfileBuild(
+        profile=profile,
+        generated_source=generated_source,
+        source_pdf=OUT_DIR / f"{generated_source.stem}.pdf",
+        final_pdf=OUTPUTS_DIR / f"resume-{profile.profile}.pdf",
+        log_file=log_file,
+        log_mtime_ns=file_mtime_ns(log_file),
+        latexmk_log=AUX_DIR / f"{generated_source.stem}.latexmk.log",
+        stamp_file=STAMPS_DIR / f"{profile.profile}.stamp",
+        contents=contents,
+        digest=digest.hexdigest(),
+    )
+
+
+@lru_cache(maxsize=1)
+def input_fingerprint() -> bytes:
+    # The generated source already covers the profile and resume.tex preamble;
+    # this covers everything it pulls in, plus the build script itself.
+    paths = [RESUME_STY, LATEXMKRC, BUILD_SCRIPT]
 
-    generated_source.write_text(render_resume(profile), encoding="utf-8")
+    for directory in (SECTIONS_DIR, ASSETS_DIR):
+        paths.extend(path for path in directory.rglob("*") if path.is_file())
 
-    cmd = [
-        "latexmk",
+    digest = hashlib.blake2b(digest_size=16)
+
+    for path in sorted(paths):
+        if not path.exists():
+            continue
+
+        digest.update(path.relative_to(REPOSITORY_ROOT).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+
+    return digest.digest()
+
+
+def is_up_to_date(build: ProfileBuild) -> bool:
+    if not build.final_pdf.exists():
+        return False
+
+    try:
+        return build.stamp_file.read_text(encoding="utf-8") == build.digest
+    except OSError:
+        return False
+
+
+@lru_cache(maxsize=1)
+def latexmk_options() -> tuple[str, ...]:
+    # latexmk keeps its dependency database in AUX_DIR between runs, so
+    # unchanged sources are not recompiled from scratch on every build.
+    options = [
         "-pdf",
         "-halt-on-error",
         "-interaction=nonstopmode",
         "-recorder",
-        "-synctex=1",
         "-file-line-error",
         "-f",
-        "-gg",
         "-cd",
-        str(generated_source),
     ]
 
-    print_build_header(profile, generated_source, final_pdf, log_file)
+    # SyncTeX data only serves editor source navigation during local work.
+    if os.environ.get("RESUME_BUILD_DEV"):
+        options.append("-synctex=1")
+
+    return tuple(options)
+
 
+def stage_source(build: ProfileBuild) -> None:
+    # latexmk only accepts its root document as a file. Skip the write when a
+    # source left behind by an interrupted run already has these bytes.
     try:
+        if build.generated_source.read_bytes() == build.contents:
+            return
+    except FileNotFoundError:
+        pass
+
+    write_atomic(build.generated_source, build.contents)
+
+
+def start_build(build: ProfileBuild) -> subprocess.Popen[bytes]:
+    cmd = ["latexmk", *latexmk_options(), str(build.generated_source)]
+
+    print_build_header(build.profile, build.generated_source, build.final_pdf, build.log_file)
+
+    # Send latexmk's console output to a file rather than the terminal or a
+    # pipe, so concurrent builds don't interleave and nothing blocks on it.
+    with build.latexmk_log.open("wb") as output:
         try:
-            result = subprocess.run(cmd, cwd=REPOSITORY_ROOT, check=False)
+            return subprocess.Popen(
+                cmd,
+                cwd=REPOSITORY_ROOT,
+                stdout=output,
+                stderr=subprocess.STDOUT,
+            )
         except FileNotFoundError as exc:
             raise FileNotFoundError("latexmk is not installed or not available on PATH.") from exc
 
-        if result.returncode != 0:
-            print_log_tail(log_file)
-            raise RuntimeError(
-                f"LaTeX build failed for profile '{profile.profile}'.\n"
-                f"Log file: {log_file}\n"
-                f"Open log: open {log_file}\n"
-                f"Tail log: tail --lines=100 {log_file}"
-            )
 
-        if not source_pdf.exists():
-            print_log_tail(log_file)
-            raise FileNotFoundError(f"Expected PDF not found: {source_pdf}")
+def finish_build(build: ProfileBuild, process: subprocess.Popen[bytes]) -> None:
+    returncode = process.wait()
+
+    if returncode != 0:
+        log_file = print_build_logs(build)
+        raise RuntimeError(
+            f"LaTeX build failed for profile '{build.profile.profile}'.\n"
+            f"Log file: {log_file}\n"
+            f"latexmk output: {build.latexmk_log}\n"
+            f"Open log: open {log_file}\n"
+            f"Tail log: tail --lines=100 {log_file}"
+        )
 
-        shutil.copy2(source_pdf, final_pdf)
-        print_success(profile, final_pdf)
-        return final_pdf
+    if not build.source_pdf.exists():
+        print_build_logs(build)
+        raise FileNotFoundError(f"Expected PDF not found: {build.source_pdf}")
 
-    finally:
-        generated_source.unlink(missing_ok=True)
+    publish_pdf(build.source_pdf, build.final_pdf)
+    write_atomic(build.stamp_file, build.digest.encode("utf-8"))
+    print_success(build.profile, build.final_pdf)
+
+
+def publish_pdf(source_pdf: Path, final_pdf: Path) -> None:
+    source_stat = source_pdf.stat()
+
+    try:
+        final_stat = final_pdf.stat()
+    except FileNotFoundError:
+        pass
+    else:
+        # copy2 preserves mtime, so a matching size and mtime means latexmk
+        # left the PDF untouched and the published copy is still current.
+        if (
+            final_stat.st_size == source_stat.st_size
+            and final_stat.st_mtime_ns == source_stat.st_mtime_ns
+        ):
+            return
+
+    clone_file(source_pdf, final_pdf)
+
+
+def clone_file(source: Path, destination: Path) -> None:
+    # Hard links are not an option here: latexmk rewrites its output PDF in
+    # place, which would also truncate the published copy mid-build. A
+    # copy-on-write clone shares blocks without sharing the inode.
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        ficlone = getattr(fcntl, "FICLONE", 0x40049409)
+
+        try:
+            with source.open("rb") as src, destination.open("wb") as dst:
+                fcntl.ioctl(dst.fileno(), ficlone, src.fileno())
+        except OSError:
+            pass
+        else:
+            shutil.copystat(source, destination)
+            return
+
+    shutil.copy2(source, destination)
+
+
+def render_resume(profile: ProfileConfig) -> bytes:
+    prefix, suffix = load_resume_template()
+    body = "\n\n".join(iter_body_lines(profile))
+    return prefix + body.encode("utf-8") + suffix
+
+
+def iter_body_lines(profile: ProfileConfig) -> Iterator[str]:
+    yield "\\pagestyle{fancy}"
+
+    for section in profile.rendered_sections:
+        yield f"\\input{{sections/{section}}}"
+
+        if section == "header":
+            yield "\\vspace{0.5em}"
 
 
-def render_resume(profile: ProfileConfig) -> str:
+@lru_cache(maxsize=1)
+def load_resume_template() -> tuple[bytes, bytes]:
     source = RESUME_TEX.read_text(encoding="utf-8")
     document_start = "\\begin{document}"
     document_end = "\\end{document}"
@@ -210,20 +447,11 @@ def render_resume(profile: ProfileConfig) -> str:
     except ValueError as exc:
         raise ValueError(f"Unable to locate document markers in {RESUME_TEX}") from exc
 
-    included_sections = set(profile.included_sections)
-    rendered_sections: list[str] = ["\\pagestyle{fancy}"]
-
-    for section in profile.section_order:
-        if section not in included_sections:
-            continue
-
-        rendered_sections.append(f"\\input{{sections/{section}}}")
-
-        if section == "header":
-            rendered_sections.append("\\vspace{0.5em}")
-
-    body = "\n\n".join(rendered_sections)
-    return f"{preamble}{document_start}\n\n{body}\n\n{document_end}\n"
+    # Only the body varies between profiles; the text around it is encoded
+    # once and shared by every render.
+    prefix = f"{preamble}{document_start}\n\n".encode("utf-8")
+    suffix = f"\n\n{document_end}\n".encode("utf-8")
+    return prefix, suffix
 
 
 def validate_sections(
@@ -252,6 +480,13 @@ def validate_sections(
 
 
 def load_yaml(profile_path: Path) -> dict[str, Any]:
+    source_stat = profile_path.stat()
+    cache_path = PROFILE_CACHE_DIR / f"{profile_path.name}.json"
+    cached = read_profile_cache(cache_path, source_stat)
+
+    if cached is not None:
+        return cached
+
     contents = profile_path.read_text(encoding="utf-8")
 
     try:
@@ -259,14 +494,134 @@ def load_yaml(profile_path: Path) -> dict[str, Any]:
     except ImportError:
         data = load_simple_yaml(contents)
     else:
-        data = yaml.safe_load(contents) or {}
+        # Prefer the libyaml-backed loader bundled with most PyYAML wheels.
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(contents, Loader=loader) or {}
 
     if not isinstance(data, dict):
         raise ValueError(f"Profile must be a YAML mapping: {profile_path.name}")
 
+    write_profile_cache(cache_path, source_stat, data)
     return data
 
 
+def read_profile_cache(cache_path: Path, source_stat: os.stat_result) -> dict[str, Any] | None:
+    try:
+        cached = decode_json(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict):
+        return None
+
+    if (
+        cached.get("mtime_ns") != source_stat.st_mtime_ns
+        or cached.get("size") != source_stat.st_size
+        or not isinstance(cached.get("data"), dict)
+    ):
+        return None
+
+    return cached["data"]
+
+
+def write_profile_cache(
+    cache_path: Path,
+    source_stat: os.stat_result,
+    data: dict[str, Any],
+) -> None:
+    payload = {
+        "mtime_ns": source_stat.st_mtime_ns,
+        "size": source_stat.st_size,
+        "data": data,
+    }
+
+    try:
+        contents = encode_json(payload)
+    except (TypeError, ValueError):
+        # Profiles holding values JSON cannot represent are simply not cached.
+        return
+
+    # A warm cache replaces the YAML as the input to validation, so only cache
+    # data that decodes back unchanged. This rejects lossy conversions such as
+    # json turning int or bool keys into strings, which would otherwise
+    # validate differently.
+    if decode_json(contents) != payload:
+        return
+
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(cache_path, contents)
+    except OSError:
+        # The cache is an optimization only; a read-only checkout still builds.
+        return
+
+
+def write_atomic(path: Path, contents: bytes) -> None:
+    file_descriptor, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+
+    try:
+        with os.fdopen(file_descriptor, "wb") as handle:
+            handle.write(contents)
+
+        # mkstemp creates owner-only files. The mode is fixed rather than taken
+        # from the umask so that files written by root inside the CI TeX
+        # container stay readable when actions/cache archives .cache.
+        os.chmod(temp_name, 0o644)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def encode_json(data: Any) -> bytes:
+    try:
+        import orjson
+    except ImportError:
+        return json.dumps(data, ensure_ascii=False, allow_nan=False).encode("utf-8")
+
+    # orjson writes NaN and Infinity as null instead of refusing them the way
+    # json.dumps(allow_nan=False) does, so check for them up front. Dates,
+    # dataclasses and str subclasses, which orjson would encode natively, are
+    # routed to a default that refuses them. Key coercion still differs (json
+    # turns int keys into strings, orjson rejects them); write_profile_cache()
+    # catches that with its round-trip check.
+    reject_non_finite_floats(data)
+    return orjson.dumps(
+        data,
+        default=reject_json_value,
+        option=(
+            orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_SUBCLASS
+        ),
+    )
+
+
+def reject_json_value(value: Any) -> Any:
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def reject_non_finite_floats(value: Any) -> None:
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError("Out of range float values are not JSON compliant")
+
+    if isinstance(value, dict):
+        for item in value.values():
+            reject_non_finite_floats(item)
+    elif isinstance(value, list):
+        for item in value:
+            reject_non_finite_floats(item)
+
+
+def decode_json(contents: bytes) -> Any:
+    try:
+        import orjson
+    except ImportError:
+        return json.loads(contents)
+
+    return orjson.loads(contents)
+
+
 def first_scalar(data: dict[str, Any], keys: tuple[str, ...], profile_path: Path) -> str:
     for key in keys:
         value = data.get(key)
@@ -427,6 +782,14 @@ def print_success(profile: ProfileConfig, final_pdf: Path) -> None:
     print()
 
 
+def print_up_to_date(profile: ProfileConfig, final_pdf: Path) -> None:
+    print()
+    print(f"{Color.GREEN}✅ Up to date{Color.RESET}")
+    print(f"{Color.BOLD}Profile:{Color.RESET} {profile.profile}")
+    print(f"{Color.BOLD}PDF:{Color.RESET}     {final_pdf}")
+    print()
+
+
 def print_error(message: str) -> None:
     print()
     print(f"{Color.RED}❌ Error{Color.RESET}", file=sys.stderr)
@@ -434,13 +797,27 @@ def print_error(message: str) -> None:
     print()
 
 
-def print_log_tail(log_file: Path, lines: int = 80) -> None:
+def print_build_logs(build: ProfileBuild) -> Path:
+    # latexmk can fail before LaTeX runs, e.g. on a bad option. The aux
+    # directory keeps the previous run's LaTeX log, so only trust it when
+    # this build rewrote it. Returns the log that was printed.
+    log_mtime_ns = file_mtime_ns(build.log_file)
+
+    if log_mtime_ns is not None and log_mtime_ns != build.log_mtime_ns:
+        print_log_tail(build.log_file)
+        return build.log_file
+
+    print_log_tail(build.latexmk_log, label="latexmk output")
+    return build.latexmk_log
+
+
+def print_log_tail(log_file: Path, lines: int = 80, label: str = "LaTeX log") -> None:
     if not log_file.exists():
-        print(f"{Color.YELLOW}No LaTeX log file found: {log_file}{Color.RESET}")
+        print(f"{Color.YELLOW}No {label} file found: {log_file}{Color.RESET}")
         return
 
     print()
-    print(f"{Color.YELLOW}Last {lines} lines from LaTeX log:{Color.RESET}")
+    print(f"{Color.YELLOW}Last {lines} lines from {label}:{Color.RESET}")
     print(f"{Color.YELLOW}{'─' * 80}{Color.RESET}")
 
     contents = log_file.read_text(encoding="utf-8", errors="ignore").splitlines()
@@ -452,6 +829,13 @@ def print_log_tail(log_file: Path, lines: int = 80) -> None:
     print()
 
 
+def file_mtime_ns(path: Path) -> int | None:
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
 def open_pdf(pdf_path: Path) -> None:
     if not pdf_path.exists():
         return